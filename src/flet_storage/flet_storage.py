@@ -1,9 +1,104 @@
 import asyncio
+import base64
 import json
+import re
+import weakref
+import zlib
+from collections import OrderedDict
 from typing import Any
 
 import flet as ft
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson decodes integers outside the int64/uint64 range as floats. Any run of
+# 19 or more digits may be such an integer (int64 min has 19 digits), so those
+# payloads are left to the standard json module.
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+# Every serialized set contains this exact token. A plain dict that happens to
+# use a '__type__' key only costs a harmless extra pass.
+_SET_MARKER = '"__type__"'
+
+# JSON literals of True, False and None; looked up only after an exact type
+# check, since True == 1 and False == 0.
+_JSON_LITERALS = {True: "true", False: "false", None: "null"}
+_JSON_VALUES = {"true": True, "false": False, "null": None}
+
+# JSON payloads of at least _COMPRESS_MIN_LENGTH characters are stored
+# zlib-compressed and base64-encoded behind _COMPRESSED_PREFIX, which no JSON
+# text starts with.
+_COMPRESS_MIN_LENGTH = 1024
+_COMPRESSED_PREFIX = "zlib:"
+
+# Types of decoded values that can be handed out again without copying.
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Number of decoded values remembered per FletStorage instance.
+_CACHE_SIZE = 64
+
+# Number of platform calls kept in flight by bulk operations.
+_MAX_CONCURRENCY = 16
+
+
+def _set_default(obj, _set=set, _list=list):
+    """
+    JSON serializer helper that handles 'set' objects.
+
+    Converts sets to a special dict format with type metadata to preserve
+    the set type during deserialization. The builtins it uses are bound as
+    defaults, so each call needs no global lookups.
+
+    Args:
+        obj: Object to serialize (expecting a set).
+
+    Returns:
+        dict: A dictionary with '__type__' marker and set values as list.
+
+    Raises:
+        TypeError: If obj is not a set (allows default encoder to handle it).
+
+    Example:
+        _set_default({"python", "flet"})
+        {'__type__': 'set', 'values': ['python', 'flet']}
+    """
+    if isinstance(obj, _set):
+        return {"__type__": "set", "values": _list(obj)}
+    raise TypeError
+
+
+def _object_hook(dct, _get=dict.get):
+    """
+    JSON deserializer helper that reconstructs sets from stored format.
+
+    Checks each dictionary during deserialization for the '__type__': 'set'
+    marker and converts it back to a Python set. The marker always has
+    exactly two keys, so other dicts are rejected by a cheap length check
+    before any key lookup.
+
+    Args:
+        dct: Dictionary from JSON deserialization.
+
+    Returns:
+        set or dict: Original set if marker found, otherwise unchanged dict.
+
+    Example:
+        _object_hook({'__type__': 'set', 'values': ['python', 'flet']})
+        {'python', 'flet'}
+    """
+    if len(dct) == 2 and _get(dct, "__type__") == "set":
+        return {*dct["values"]}
+    return dct
+
+
+# Standard json codecs. json.dumps/json.loads build a new encoder or decoder
+# on every call that passes 'default' or 'object_hook'; these are built once.
+_JSON_ENCODER = json.JSONEncoder(default=_set_default)
+_JSON_DECODER = json.JSONDecoder(object_hook=_object_hook)
+
 
 class FletStorage:
     """
@@ -23,6 +118,12 @@ class FletStorage:
         tags = await storage.get("tags")  # Returns set, not list!
     """
 
+    # SharedPreferences services are registered with the page (session) they are
+    # created in, so one instance is shared by all namespaces of the same page.
+    # Pages are unhashable, so entries are keyed by id(page) and hold a weak
+    # reference that is checked before reuse and drops the entry with the page.
+    _storages: "dict[int, tuple[weakref.ref[ft.Page], ft.SharedPreferences]]" = {}
+
     def __init__(self, app_name: str) -> None:
         """
         Initializes the storage with a specific namespace.
@@ -31,54 +132,243 @@ class FletStorage:
             app_name: The unique namespace for the application.
         """
         self.app_name = app_name
-        self.storage = ft.SharedPreferences()
+        self.storage = self._shared_storage()
+        self._prefix = f"{app_name}."
+        self._prefix_len = len(self._prefix)
+        self._dec_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
 
-    @staticmethod
-    def _set_default(obj):
+    @classmethod
+    def _shared_storage(cls) -> ft.SharedPreferences:
+        """
+        Returns the SharedPreferences service of the current page.
+
+        Creating a service registers it with the page and pushes a page update,
+        so the instance is created once per page and reused afterwards.
+
+        Returns:
+            ft.SharedPreferences: The shared service, or a new one if there is
+            no current page.
         """
-        JSON serializer helper that handles 'set' objects.
+        try:
+            page = ft.context.page
+        except RuntimeError:
+            return ft.SharedPreferences()
+
+        page_id = id(page)
+        entry = cls._storages.get(page_id)
+        if entry is not None and entry[0]() is page:
+            return entry[1]
+
+        storage = ft.SharedPreferences()
+        page_ref = weakref.ref(page, lambda _: cls._storages.pop(page_id, None))
+        cls._storages[page_id] = (page_ref, storage)
+        return storage
+
+    @classmethod
+    def _rehydrate(cls, obj):
+        """
+        Reconstructs sets in an already decoded object tree.
 
-        Converts sets to a special dict format with type metadata to preserve
-        the set type during deserialization.
+        orjson has no 'object_hook', so set markers are restored in a single
+        pass after decoding instead. Containers are updated in place and the
+        walk only descends into dicts and lists.
 
         Args:
-            obj: Object to serialize (expecting a set).
+            obj: Object returned by orjson.loads.
 
         Returns:
-            dict: A dictionary with '__type__' marker and set values as list.
+            Any: The object with every set marker replaced by a Python set.
+        """
+        obj_type = type(obj)
+        if obj_type is dict:
+            if len(obj) == 2 and obj.get("__type__") == "set":
+                return {*obj["values"]}
+            for k, v in obj.items():
+                v_type = type(v)
+                if v_type is dict or v_type is list:
+                    obj[k] = cls._rehydrate(v)
+        elif obj_type is list:
+            for i, v in enumerate(obj):
+                v_type = type(v)
+                if v_type is dict or v_type is list:
+                    obj[i] = cls._rehydrate(v)
+        return obj
+
+    def _dumps(self, obj: object) -> str:
+        """
+        Serializes an object to a JSON string.
+
+        Always uses the standard json module, even when orjson is installed:
+        orjson writes NaN and infinity as null and natively encodes types such
+        as datetime, UUID and dataclasses, so what set() stores or rejects
+        would depend on an optional dependency.
+
+        Args:
+            obj: Object to serialize.
+
+        Returns:
+            str: The JSON representation of the object.
 
         Raises:
-            TypeError: If obj is not a set (allows default encoder to handle it).
+            TypeError: If the object is not JSON-serializable.
+        """
+        # Scalars are formatted by hand, skipping the encoder entirely.
+        obj_type = type(obj)
+        if obj_type is str:
+            if obj.isprintable():
+                return '"' + obj.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        elif obj_type is bool or obj is None:
+            return _JSON_LITERALS[obj]
+        elif obj_type is int:
+            return str(obj)
+
+        return _JSON_ENCODER.encode(obj)
 
-        Example:
-            _set_default({"python", "flet"})
-            {'__type__': 'set', 'values': ['python', 'flet']}
+    @staticmethod
+    def _pack(obj_json: str) -> str:
         """
-        if isinstance(obj, set):
-            return {"__type__": "set", "values": list(obj)}
-        raise TypeError
+        Compresses a large JSON payload for storage.
+
+        Payloads of at least _COMPRESS_MIN_LENGTH characters are compressed at
+        the fastest zlib level and kept only if that makes them shorter.
+
+        Args:
+            obj_json: The JSON string to store.
+
+        Returns:
+            str: The value to pass to SharedPreferences.
+        """
+        if len(obj_json) < _COMPRESS_MIN_LENGTH:
+            return obj_json
+
+        packed = _COMPRESSED_PREFIX + base64.b64encode(
+            zlib.compress(obj_json.encode(), 1)
+        ).decode("ascii")
+        return packed if len(packed) < len(obj_json) else obj_json
 
     @staticmethod
-    def _object_hook(dct):
+    def _unpack(raw: str) -> str:
+        """
+        Restores the JSON payload of a value written by _pack.
+
+        Args:
+            raw: The raw value returned by SharedPreferences.
+
+        Returns:
+            str: The JSON string.
+
+        Raises:
+            ValueError: If compressed data is corrupted.
+        """
+        if not raw.startswith(_COMPRESSED_PREFIX):
+            return raw
+
+        try:
+            data = base64.b64decode(raw[len(_COMPRESSED_PREFIX) :], validate=True)
+            return zlib.decompress(data).decode()
+        except zlib.error as e:
+            raise ValueError(e)
+
+    def _loads(self, obj_json: str) -> Any:
         """
-        JSON deserializer helper that reconstructs sets from stored format.
+        Deserializes a JSON string, restoring sets.
 
-        Checks each dictionary during deserialization for the '__type__': 'set'
-        marker and converts it back to a Python set.
+        Uses orjson when it is installed and falls back to the standard json
+        module for data orjson rejects or may misread (NaN, very large integers).
+        orjson also reuses the str objects of short dict keys across calls, so
+        repeated key names are not allocated and hashed again on every read.
 
         Args:
-            dct: Dictionary from JSON deserialization.
+            obj_json: The JSON string to deserialize.
 
         Returns:
-            set or dict: Original set if marker found, otherwise unchanged dict.
+            Any: The deserialized Python object.
 
-        Example:
-            _object_hook({'__type__': 'set', 'values': ['python', 'flet']})
-            {'python', 'flet'}
+        Raises:
+            json.JSONDecodeError: If the data is not valid JSON.
+        """
+        # Scalars written by _dumps are parsed by hand, skipping the decoder.
+        # Anything the JSON grammar rejects (raw control characters, leading
+        # zeros) is left to the decoder so that it still raises.
+        if obj_json in _JSON_VALUES:
+            return _JSON_VALUES[obj_json]
+        if obj_json[:1] == '"':
+            if (
+                obj_json[-1:] == '"'
+                and obj_json.count('"') == 2
+                and "\\" not in obj_json
+                and obj_json.isprintable()
+            ):
+                return obj_json[1:-1]
+        else:
+            digits = obj_json[1:] if obj_json[:1] == "-" else obj_json
+            if (
+                digits.isdigit()
+                and digits.isascii()
+                and (digits[0] != "0" or len(digits) == 1)
+            ):
+                return int(obj_json)
+
+        if orjson is not None and not _LONG_DIGITS.search(obj_json):
+            try:
+                obj = orjson.loads(obj_json)
+            except orjson.JSONDecodeError:
+                pass
+            else:
+                # Only payloads that contain a set marker need the extra walk.
+                if _SET_MARKER in obj_json:
+                    obj = self._rehydrate(obj)
+                return obj
+        return _JSON_DECODER.decode(obj_json)
+
+    def _decode(self, key: str, obj_json: str | None) -> Any:
         """
-        if dct.get("__type__") == "set":
-            return set(dct["values"])
-        return dct
+        Deserializes a raw value fetched from the storage.
+
+        Scalar results of recently read keys are remembered together with the
+        raw value; reading the same raw value again returns them without
+        decoding. Lists, dicts and sets are always decoded afresh, since
+        callers may modify them and copying would cost about as much as
+        decoding.
+
+        Args:
+            key: The key identifier the value belongs to (used in errors).
+            obj_json: The raw value returned by SharedPreferences.
+
+        Returns:
+            Any: The deserialized Python object.
+
+        Raises:
+            KeyError: If the value is missing.
+            ValueError: If the stored data is not valid JSON.
+        """
+        if obj_json is None:
+            raise KeyError(f"Key '{key}' not found in '{self.app_name}' namespace")
+
+        cache = self._dec_cache
+        cached = cache.get(key)
+        if cached is not None and cached[0] == obj_json:
+            cache.move_to_end(key)
+            return cached[1]
+
+        try:
+            payload = self._unpack(obj_json)
+        except ValueError as e:
+            raise ValueError(f"Invalid compressed data for key '{key}': {e}")
+
+        try:
+            obj = self._loads(payload)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON for key '{key}': {e}")
+
+        if type(obj) in _SCALAR_TYPES:
+            cache[key] = (obj_json, obj)
+            cache.move_to_end(key)
+            if len(cache) > _CACHE_SIZE:
+                cache.popitem(last=False)
+        elif cached is not None:
+            del cache[key]
+        return obj
 
     async def set(self, key: str, obj: object) -> bool:
         """
@@ -92,11 +382,35 @@ class FletStorage:
             bool: True if the operation was successful.
         """
 
-        name_obj = f"{self.app_name}.{key}"
-        obj_json = json.dumps(obj, default=self._set_default)
+        name_obj = self._prefix + key
+        obj_json = self._pack(self._dumps(obj))
 
         return await self.storage.set(name_obj, obj_json)
 
+    async def set_many(self, items: dict[str, object]) -> bool:
+        """
+        Serializes several objects and stores them under namespaced keys.
+
+        All objects are serialized before anything is written, so a value that
+        cannot be serialized leaves the storage untouched. Writes run with
+        bounded concurrency.
+
+        Args:
+            items: Mapping of key identifiers (without namespace) to objects.
+
+        Returns:
+            bool: True if every write was successful.
+        """
+        payload = [
+            (self._prefix + key, self._pack(self._dumps(obj)))
+            for key, obj in items.items()
+        ]
+        results = await self._gather_bounded(
+            lambda item: self.storage.set(*item), payload
+        )
+
+        return all(results)
+
     async def get(self, key: str) -> Any:
         """
         Retrieves and deserializes an object by its key.
@@ -111,15 +425,9 @@ class FletStorage:
             KeyError: If the key does not exist in the storage.
             ValueError: If the stored data is not valid JSON.
         """
-        obj_json = await self.storage.get(f"{self.app_name}.{key}")
+        obj_json = await self.storage.get(self._prefix + key)
 
-        if obj_json is None:
-            raise KeyError(f"Key '{key}' not found in '{self.app_name}' namespace")
-
-        try:
-            return json.loads(obj_json, object_hook=self._object_hook)
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Invalid JSON for key '{key}': {e}")
+        return self._decode(key, obj_json)
 
     async def get_or_default(self, key: str, default: Any = None) -> Any:
         """
@@ -135,11 +443,35 @@ class FletStorage:
         Raises:
             ValueError: If the stored data is not valid JSON.
         """
-        try:
-            return await self.get(key)
-        except KeyError:
+        obj_json = await self.storage.get(self._prefix + key)
+
+        if obj_json is None:
             return default
 
+        return self._decode(key, obj_json)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """
+        Retrieves and deserializes several objects by their keys.
+
+        Values are fetched with bounded concurrency and decoded afterwards.
+
+        Args:
+            keys: The key identifiers to look up.
+
+        Returns:
+            dict[str, Any]: Mapping of each key to its deserialized object.
+
+        Raises:
+            KeyError: If any of the keys does not exist in the storage.
+            ValueError: If any of the stored values is not valid JSON.
+        """
+        raw = await self._gather_bounded(
+            self.storage.get, [self._prefix + key for key in keys]
+        )
+
+        return {key: self._decode(key, obj_json) for key, obj_json in zip(keys, raw)}
+
     async def contains_key(self, key: str) -> bool:
         """
         Checks if a specific key exists within the application namespace.
@@ -150,7 +482,7 @@ class FletStorage:
         Returns:
             bool: True if the key exists, False otherwise.
         """
-        return await self.storage.contains_key(f"{self.app_name}.{key}")
+        return await self.storage.contains_key(self._prefix + key)
 
     async def remove(self, key: str) -> bool:
         """
@@ -162,7 +494,7 @@ class FletStorage:
         Returns:
             bool: True if the operation was successful.
         """
-        return await self.storage.remove(f"{self.app_name}.{key}")
+        return await self.storage.remove(self._prefix + key)
 
     async def get_keys(self) -> list[str]:
         """
@@ -171,14 +503,17 @@ class FletStorage:
         Returns:
             list[str]: A list of keys with the 'app_name.' prefix removed.
         """
-        data = await self.storage.get_keys(self.app_name)
+        # Filtering by 'app_name.' rather than 'app_name' keeps keys of other
+        # namespaces that merely start with the same name (e.g. 'app_name2.')
+        # out, so every returned key carries the full prefix.
+        data = await self.storage.get_keys(self._prefix)
 
         if not data:
             return []
 
-        prefix = f"{self.app_name}."
+        prefix_len = self._prefix_len
 
-        return [item.removeprefix(prefix) for item in data]
+        return [item[prefix_len:] for item in data]
 
     async def clear(self) -> None:
         """
@@ -186,4 +521,42 @@ class FletStorage:
         Other namespaces in SharedPreferences remain untouched.
         """
         keys = await self.get_keys()
-        await asyncio.gather(*[self.remove(key) for key in keys])
+        await self._bulk_remove(keys)
+
+    @staticmethod
+    async def _gather_bounded(func, items: list) -> list:
+        """
+        Awaits func(item) for every item with bounded concurrency.
+
+        A fixed pool of _MAX_CONCURRENCY workers pulls items from a shared
+        iterator, so a new call starts as soon as any previous one finishes
+        and large namespaces do not flood the event loop and the platform
+        channel.
+
+        Args:
+            func: Coroutine function called with a single item.
+            items: Items to process.
+
+        Returns:
+            list: Results in the same order as items.
+        """
+        results = [None] * len(items)
+        pending = iter(enumerate(items))
+
+        async def worker():
+            for i, item in pending:
+                results[i] = await func(item)
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(_MAX_CONCURRENCY, len(items))))
+        )
+        return results
+
+    async def _bulk_remove(self, keys: list[str]) -> None:
+        """
+        Removes several keys with bounded concurrency.
+
+        Args:
+            keys: The key identifiers to remove.
+        """
+        await self._gather_bounded(self.remove, keys)
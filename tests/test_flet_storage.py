@@ -0,0 +1,284 @@
+import asyncio
+import gc
+import math
+import weakref
+from dataclasses import dataclass, field
+from datetime import date
+
+import pytest
+from flet.controls.context import _context_page
+
+import flet_storage.flet_storage as module
+from flet_storage import FletStorage
+
+
+class MemoryPreferences:
+    """In-memory stand-in for flet.SharedPreferences."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def set(self, key, value):
+        assert isinstance(value, str)
+        self.data[key] = value
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def contains_key(self, key):
+        return key in self.data
+
+    async def remove(self, key):
+        self.data.pop(key, None)
+        return True
+
+    async def get_keys(self, key_prefix):
+        return [key for key in self.data if key.startswith(key_prefix)]
+
+
+class ServiceRegistry:
+    """Records services registered with a FakePage."""
+
+    def __init__(self):
+        self.services = []
+
+    def register_service(self, service):
+        self.services.append(service)
+
+
+@dataclass
+class FakePage:
+    """Unhashable stand-in for flet.Page, which is an eq=True dataclass."""
+
+    _services: ServiceRegistry = field(default_factory=ServiceRegistry)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def storage(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(module, "orjson", None)
+
+    storage = FletStorage("test")
+    storage.storage = MemoryPreferences()
+    return storage
+
+
+def round_trip(storage, obj):
+    """Stores obj, then reads it back; returns the raw stored value too."""
+
+    async def scenario():
+        assert await storage.set("key", obj)
+        return await storage.get("key")
+
+    result = asyncio.run(scenario())
+    return storage.storage.data["test.key"], result
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        None,
+        True,
+        False,
+        0,
+        -42,
+        3.5,
+        "",
+        "dark",
+        'he said "hi" \\ bye',
+        "line\nbreak\ttab\x01",
+        "привіт 😀",
+        -9999999999999999999,
+        -9223372036854775809,
+        18446744073709551616,
+        10**30,
+        [-9999999999999999999],
+        {"a": -9223372036854775809},
+        [1, "two", None, [3.5]],
+        {"a": {"b": [1, 2]}, "c": ""},
+        {"x", "y"},
+        {"tags": {"web", "mobile"}, "list": [{1, 2}, {"n": -9999999999999999999}]},
+    ],
+)
+def test_round_trip(storage, obj):
+    _, result = round_trip(storage, obj)
+
+    assert result == obj
+    assert type(result) is type(obj)
+
+
+@pytest.mark.parametrize("value", [math.inf, -math.inf])
+def test_round_trip_infinity(storage, value):
+    _, result = round_trip(storage, {"x": value, "l": [value]})
+
+    assert result == {"x": value, "l": [value]}
+
+
+def test_round_trip_nan(storage):
+    _, result = round_trip(storage, [math.nan])
+
+    assert math.isnan(result[0])
+
+
+def test_tuple_is_stored_as_list(storage):
+    _, result = round_trip(storage, (1, "a", (2,)))
+
+    assert result == [1, "a", [2]]
+
+
+@pytest.mark.parametrize(
+    "raw", ["{nope", "[1,", '"unterminated', "007", "-01", '"\x01"']
+)
+def test_invalid_data_raises_value_error(storage, raw):
+    storage.storage.data["test.key"] = raw
+
+    with pytest.raises(ValueError):
+        asyncio.run(storage.get("key"))
+
+
+def test_non_json_types_raise_type_error(storage):
+    with pytest.raises(TypeError):
+        asyncio.run(storage.set("key", {"d": date(2020, 1, 1)}))
+
+
+def test_storage_api(storage):
+    other = FletStorage("other")
+    other.storage = storage.storage
+
+    async def scenario():
+        await other.set("x", 1)
+        assert await storage.set("tags", {"a"})
+        assert await storage.set_many({"n": 1, "list": ["v" * 100] * 20})
+        assert await storage.get("tags") == {"a"}
+        assert await storage.get_many(["n", "list"]) == {
+            "n": 1,
+            "list": ["v" * 100] * 20,
+        }
+        with pytest.raises(KeyError):
+            await storage.get_many(["n", "missing"])
+        assert await storage.get_or_default("missing", 5) == 5
+        with pytest.raises(KeyError):
+            await storage.get("missing")
+        assert await storage.contains_key("n")
+        assert sorted(await storage.get_keys()) == ["list", "n", "tags"]
+        await storage.clear()
+        assert await storage.get_keys() == []
+        assert await other.get("x") == 1
+
+    asyncio.run(scenario())
+
+
+def test_set_many_writes_nothing_if_a_value_fails(storage):
+    with pytest.raises(TypeError):
+        asyncio.run(storage.set_many({"a": 1, "b": date(2020, 1, 1)}))
+
+    assert storage.storage.data == {}
+
+
+def count_loads(storage, monkeypatch):
+    calls = []
+    loads = storage._loads
+
+    def counting_loads(obj_json):
+        calls.append(obj_json)
+        return loads(obj_json)
+
+    monkeypatch.setattr(storage, "_loads", counting_loads)
+    return calls
+
+
+def test_decode_cache_returns_scalar_without_decoding(storage, monkeypatch):
+    calls = count_loads(storage, monkeypatch)
+    raw = '"' + "x" * 300 + '"'
+
+    first = storage._decode("key", raw)
+    second = storage._decode("key", raw)
+
+    assert second is first
+    assert calls == [raw]
+
+
+def test_decode_cache_follows_stored_value(storage, monkeypatch):
+    calls = count_loads(storage, monkeypatch)
+
+    assert storage._decode("key", "1.5") == 1.5
+    assert storage._decode("key", "2.5") == 2.5
+    assert storage._decode("key", "2.5") == 2.5
+    assert calls == ["1.5", "2.5"]
+
+
+@pytest.mark.parametrize("raw", ['["a", 1]', '{"a": [1]}'])
+def test_decode_cache_skips_mutable_values(storage, monkeypatch, raw):
+    calls = count_loads(storage, monkeypatch)
+
+    first = storage._decode("key", raw)
+    first.clear()
+    second = storage._decode("key", raw)
+
+    assert second and second is not first
+    assert calls == [raw, raw]
+    assert "key" not in storage._dec_cache
+
+
+@pytest.mark.parametrize("obj", [{"k": ["value"] * 300}, "text " * 300])
+def test_large_values_are_compressed(storage, obj):
+    raw, result = round_trip(storage, obj)
+
+    assert raw.startswith("zlib:")
+    assert result == obj
+
+
+@pytest.mark.parametrize("raw", ["zlib:@@@", "zlib:AAAA"])
+def test_invalid_compressed_data_raises_value_error(storage, raw):
+    storage.storage.data["test.key"] = raw
+
+    with pytest.raises(ValueError):
+        asyncio.run(storage.get("key"))
+
+
+def test_sibling_namespace_is_left_alone(storage):
+    sibling = FletStorage("test2")
+    sibling.storage = storage.storage
+
+    async def scenario():
+        await storage.set("a", 1)
+        await sibling.set("b", 2)
+        assert await storage.get_keys() == ["a"]
+        await storage.clear()
+        assert await sibling.get_keys() == ["b"]
+
+    asyncio.run(scenario())
+
+
+def test_instances_share_the_page_service():
+    page = FakePage()
+    token = _context_page.set(page)
+    try:
+        first = FletStorage("first")
+        second = FletStorage("second")
+    finally:
+        _context_page.reset(token)
+
+    assert second.storage is first.storage
+    assert page._services.services == [first.storage]
+    assert FletStorage("third").storage is not first.storage
+
+
+def test_shared_service_does_not_keep_the_page_alive():
+    page = FakePage()
+    token = _context_page.set(page)
+    try:
+        FletStorage("test")
+    finally:
+        _context_page.reset(token)
+    page_ref = weakref.ref(page)
+    page_id = id(page)
+
+    del page
+    gc.collect()
+
+    assert page_ref() is None
+    assert page_id not in FletStorage._storages